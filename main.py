@@ -1,18 +1,69 @@
+import asyncio
 import autogen
+import copy
 import dotenv
+import functools
 import os
+import re
+import sys
 import time
+
+import numpy as np
+
+# Hoisted from _fetch_info: the per-call `import yfinance` paid a
+# sys.modules lookup on every lookup, and a top-level import pulls in
+# yfinance (and the pandas stack behind it) once at startup alongside
+# the rest of the heavy imports.
+import yfinance as yf
+
+from collections import deque
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from dataclasses import dataclass
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.conditions import TextMentionTermination
-from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_agentchat.ui import Console
 from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from search import google_search
-from analyse_stock import analyze_stock
+from analyse_stock import analyze_stock_async, get_yf_session
+
+# Scale ladder for human-readable market caps, largest first. A table
+# walk keeps the formatting data-driven and ready to vectorize with
+# np.searchsorted if a batch path ever formats a whole watchlist.
+_MARKET_CAP_SCALES = ((1e12, "T"), (1e9, "B"), (1e6, "M"))
+
+
+def _format_market_cap(market_cap: float) -> str:
+    if not market_cap:
+        return "Unknown"
+    for threshold, suffix in _MARKET_CAP_SCALES:
+        if market_cap >= threshold:
+            return f"${market_cap/threshold:.2f}{suffix}"
+    return f"${market_cap:,.0f}"
+
+
+# Company metadata changes slowly, but every confirmation-loop retry used
+# to pay a fresh HTTPS round-trip to Yahoo. Info dicts are cached with an
+# hour's TTL keyed by the upper-cased ticker.
+_COMPANY_INFO_CACHE: Dict[str, tuple] = {}  # ticker -> (timestamp, info)
+_COMPANY_INFO_TTL_SECONDS = 3600
+
+
+def _fetch_info(ticker: str) -> dict:
+    key = ticker.upper()
+    cached = _COMPANY_INFO_CACHE.get(key)
+    if cached is not None and time.time() - cached[0] < _COMPANY_INFO_TTL_SECONDS:
+        return cached[1]
+
+    # The shared session keeps TLS connections to Yahoo pooled across
+    # lookups and retries transient throttling with backoff
+    info = yf.Ticker(ticker, session=get_yf_session()).info
+    if info:
+        _COMPANY_INFO_CACHE[key] = (time.time(), info)
+    return info
+
 
 def get_company_info(ticker: str) -> str:
     """
@@ -20,152 +71,206 @@ def get_company_info(ticker: str) -> str:
     This helps users verify they have the correct company.
     """
     try:
-        import yfinance as yf
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        
+        info = _fetch_info(ticker)
+
         company_name = info.get('longName', info.get('shortName', 'Unknown Company'))
         sector = info.get('sector', 'Unknown Sector')
         industry = info.get('industry', 'Unknown Industry')
         market_cap = info.get('marketCap', 0)
-        
-        if market_cap:
-            if market_cap >= 1e12:
-                market_cap_str = f"${market_cap/1e12:.2f}T"
-            elif market_cap >= 1e9:
-                market_cap_str = f"${market_cap/1e9:.2f}B"
-            elif market_cap >= 1e6:
-                market_cap_str = f"${market_cap/1e6:.2f}M"
-            else:
-                market_cap_str = f"${market_cap:,.0f}"
-        else:
-            market_cap_str = "Unknown"
-        
+        market_cap_str = _format_market_cap(market_cap)
+
         return f"Company: {company_name}\nSector: {sector}\nIndustry: {industry}\nMarket Cap: {market_cap_str}"
         
     except Exception as e:
         return f"Could not retrieve company information: {str(e)}"
 
+# Letters/digits plus the ./-/^ separators, at most 10 characters (most
+# tickers are 1-5). One C-level regex match replaces the old
+# replace/replace/replace/isalnum passes.
+_TICKER_RE = re.compile(r'^[A-Za-z0-9.\-^]{1,10}$')
+
+
 def validate_ticker(ticker: str) -> tuple[bool, str]:
     """
     Validate ticker symbol and return validation result with message.
     """
     if not ticker:
         return False, "❌ Please enter a ticker symbol."
-    
-    # Remove common suffixes and check if alphanumeric
-    clean_ticker = ticker.replace('.', '').replace('-', '').replace('^', '')
-    if not clean_ticker.isalnum():
+
+    if not _TICKER_RE.match(ticker):
+        if len(ticker) > 10:
+            return False, "❌ Ticker symbol seems too long. Please check and try again."
         return False, "❌ Invalid ticker format. Please use only letters and numbers."
-    
-    # Check length (most tickers are 1-5 characters)
-    if len(ticker) > 10:
-        return False, "❌ Ticker symbol seems too long. Please check and try again."
-    
+
     return True, "✅ Ticker symbol format is valid."
 
-# Performance tracking
-@dataclass
+
+def validate_tickers(tickers: List[str]) -> tuple[List[str], List[str]]:
+    """
+    Split a batch of ticker symbols into valid and invalid lists.
+
+    One pass over the precompiled regex handles portfolio-sized inputs
+    (thousands of symbols) without per-ticker Python branching.
+    """
+    valid: List[str] = []
+    invalid: List[str] = []
+    match = _TICKER_RE.match
+    for raw in tickers:
+        ticker = raw.strip().upper()
+        (valid if ticker and match(ticker) else invalid).append(ticker)
+    return valid, invalid
+
+
+async def fetch_company_infos(tickers: List[str]) -> Dict[str, str]:
+    """
+    Validate a batch of tickers and fetch company info for the valid
+    ones concurrently. Invalid symbols map to an error message.
+    """
+    valid, invalid = validate_tickers(tickers)
+    infos = await asyncio.gather(
+        *(asyncio.to_thread(get_company_info, ticker) for ticker in valid)
+    )
+    results = dict(zip(valid, infos))
+    for ticker in invalid:
+        results[ticker] = "❌ Invalid ticker format."
+    return results
+
+# Performance tracking: the hot start_call/end_call paths only touch raw
+# integer counters (monotonic, immune to wall-clock jumps and float
+# rounding drift); derived averages are computed once in get_report.
+@dataclass(slots=True)
 class AgentMetrics:
     name: str
     calls: int = 0
-    total_time: float = 0.0
-    success_rate: float = 0.0
-    last_call: float = 0.0
+    successes: int = 0
+    total_ns: int = 0
+    last_ns: int = 0
 
 class AgentPerformanceTracker:
     def __init__(self):
         self.metrics: Dict[str, AgentMetrics] = {}
-    
+
     def start_call(self, agent_name: str):
         if agent_name not in self.metrics:
             self.metrics[agent_name] = AgentMetrics(name=agent_name)
         self.metrics[agent_name].calls += 1
-        self.metrics[agent_name].last_call = time.time()
-    
+        self.metrics[agent_name].last_ns = time.monotonic_ns()
+
     def end_call(self, agent_name: str, success: bool = True):
         if agent_name in self.metrics:
-            duration = time.time() - self.metrics[agent_name].last_call
-            self.metrics[agent_name].total_time += duration
-            if success:
-                self.metrics[agent_name].success_rate = (
-                    (self.metrics[agent_name].success_rate * (self.metrics[agent_name].calls - 1) + 1) 
-                    / self.metrics[agent_name].calls
-                )
-    
+            metrics = self.metrics[agent_name]
+            metrics.total_ns += time.monotonic_ns() - metrics.last_ns
+            metrics.successes += int(success)
+
     def get_report(self) -> str:
-        report = "Agent Performance Report:\n"
+        # Collect lines and join once: += on strings reallocates the
+        # whole report for every appended fragment.
+        lines = ["Agent Performance Report:"]
         for agent_name, metrics in self.metrics.items():
-            avg_time = metrics.total_time / metrics.calls if metrics.calls > 0 else 0
-            report += f"\n{agent_name}:\n"
-            report += f"  Total calls: {metrics.calls}\n"
-            report += f"  Average time: {avg_time:.2f}s\n"
-            report += f"  Success rate: {metrics.success_rate:.2%}\n"
-        return report
+            avg_time = metrics.total_ns / metrics.calls / 1e9 if metrics.calls > 0 else 0
+            success_rate = metrics.successes / metrics.calls if metrics.calls > 0 else 0
+            lines.append(f"\n{agent_name}:")
+            lines.append(f"  Total calls: {metrics.calls}")
+            lines.append(f"  Average time: {avg_time:.2f}s")
+            lines.append(f"  Success rate: {success_rate:.2%}")
+        return "\n".join(lines) + "\n"
 
 # Initialize tracker
 performance_tracker = AgentPerformanceTracker()
 
-conf_list = autogen.config_list_from_dotenv(
-    dotenv_file_path=".env",
-    model_api_key_map={"gpt-4o": "OPENAI_API_KEY"} 
-)
+@functools.cache
+def get_model_client() -> OpenAIChatCompletionClient:
+    """Resolve the .env config and build the OpenAI client on first use.
+
+    Import-time construction made every import of this module (test
+    runners, forked workers) pay for env resolution and client setup.
+    """
+    autogen.config_list_from_dotenv(
+        dotenv_file_path=".env",
+        model_api_key_map={"gpt-4o": "OPENAI_API_KEY"} 
+    )
+    return OpenAIChatCompletionClient(
+        model="gpt-4o",
+        api_key=os.getenv("OPENAI_API_KEY"),
+    )
+
+
+@asynccontextmanager
+async def model_client_lifespan():
+    """Yield the shared model client, closing it only on true shutdown.
+
+    One long-lived client keeps its pooled TLS connections to OpenAI warm
+    across analyses; tearing it down inside main() would force a fresh
+    handshake on every re-entry (or per request, if this CLI is ever
+    wrapped in a server with its own lifespan hook).
+    """
+    client = get_model_client()
+    try:
+        yield client
+    finally:
+        await client.close()
 
-model_client = OpenAIChatCompletionClient(
-    model="gpt-4o",
-    api_key=os.getenv("OPENAI_API_KEY"),
-)
 
 google_search_tool = FunctionTool(
     google_search, description="Search Google for information, returns results with a snippet and body content"
 )
-stock_analysis_tool = FunctionTool(analyze_stock, description="Analyze stock data and generate a plot")
-
-# Enhanced specialized agents with memory and specific roles
-technical_analyst_agent = AssistantAgent(
-    name="Technical_Analyst",
-    model_client=model_client,
-    tools=[stock_analysis_tool],
-    description="Specialized in technical analysis, chart patterns, and trading indicators",
-    system_message="""You are a technical analyst expert. Your role is to:
-    1. Analyze stock price patterns and trends
-    2. Identify support and resistance levels
-    3. Evaluate technical indicators (RSI, MACD, moving averages)
-    4. Provide trading signals based on technical analysis
-    5. Maintain context of previous analyses for comparison
-    
-    Always provide specific technical insights with data backing.""",
-)
+stock_analysis_tool = FunctionTool(analyze_stock_async, description="Analyze stock data and generate a plot")
 
-news_researcher_agent = AssistantAgent(
-    name="News_Researcher",
-    model_client=model_client,
-    tools=[google_search_tool],
-    description="Specialized in gathering and analyzing financial news and market sentiment",
-    system_message="""You are a financial news researcher. Your role is to:
-    1. Search for recent news about the target company
-    2. Analyze market sentiment from news sources
-    3. Identify key events affecting stock performance
-    4. Track regulatory changes and industry trends
-    5. Provide context for news impact on stock price
-    
-    Focus on recent, relevant news that could affect stock performance.""",
-)
+# Risk-score bins, matching the original branch ladder exactly: the beta
+# edges are right-closed (a boundary value falls in the lower bucket),
+# the r-squared edges are left-closed, and alpha is mixed — [-0.05, 0)
+# scores 10 and [0, 0.05] scores 8, so exactly 0.05 stays in the
+# 8-point bucket.
+_ALPHA_THRESHOLDS = np.array([-0.05, 0.0, 0.05])
+_ALPHA_WEIGHTS = np.array([20, 10, 8, 5])
+_BETA_THRESHOLDS = np.array([0.8, 1.2, 1.5])
+_BETA_WEIGHTS = np.array([15, 20, 30, 40])
+_R2_THRESHOLDS = np.array([30.0, 50.0, 70.0])
+_R2_WEIGHTS = np.array([40, 30, 20, 15])
+
+# numba is optional: when present the scalar scoring core compiles to
+# machine code (cache=True amortizes the JIT across processes); without
+# it the plain-Python function behaves identically.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _risk_core(alpha: float, beta: float, r_squared: float) -> int:
+    """Pure-numeric risk score; comparisons mirror the original ladder."""
+    if alpha < -0.05:
+        score = 20
+    elif alpha < 0.0:
+        score = 10
+    elif alpha > 0.05:
+        score = 5
+    else:
+        score = 8
+
+    if beta > 1.5:
+        score += 40
+    elif beta > 1.2:
+        score += 30
+    elif beta > 0.8:
+        score += 20
+    else:
+        score += 15
+
+    if r_squared < 30.0:
+        score += 40
+    elif r_squared < 50.0:
+        score += 30
+    elif r_squared < 70.0:
+        score += 20
+    else:
+        score += 15
+    return score
 
-fundamental_analyst_agent = AssistantAgent(
-    name="Fundamental_Analyst",
-    model_client=model_client,
-    tools=[google_search_tool],
-    description="Specialized in fundamental analysis, financial ratios, and company valuation",
-    system_message="""You are a fundamental analyst expert. Your role is to:
-    1. Analyze company financial statements and ratios
-    2. Evaluate company valuation metrics (P/E, P/B, ROE)
-    3. Assess competitive position and market share
-    4. Review earnings reports and growth projections
-    5. Provide long-term investment perspective
-    
-    Focus on fundamental factors that drive long-term value.""",
-)
 
 def calculate_risk_score(alpha: float, beta: float, r_squared: float) -> dict:
     """
@@ -179,39 +284,21 @@ def calculate_risk_score(alpha: float, beta: float, r_squared: float) -> dict:
     Returns:
         Dictionary containing risk score and breakdown
     """
+    # The cache is keyed on the raw floats: the score is a step function
+    # of the unquantized inputs, so any rounding can flip a bucket for
+    # values near a threshold. lru_cache also hands every hit the same
+    # dict, so copy it before returning — a caller mutating its result
+    # must not poison the cached entry.
+    return copy.deepcopy(_score_cached(alpha, beta, r_squared))
+
+
+@functools.lru_cache(maxsize=1024)
+def _score_cached(alpha: float, beta: float, r_squared: float) -> dict:
     # Risk score calculation (0-100, higher = higher risk)
-    risk_score = 0
-    
-    # Alpha contribution (20% weight)
-    if alpha < -0.05:  # Underperforming by more than 5%
-        risk_score += 20
-    elif alpha < 0:
-        risk_score += 10
-    elif alpha > 0.05:  # Outperforming by more than 5%
-        risk_score += 5
-    else:
-        risk_score += 8
-    
-    # Beta contribution (40% weight)
-    if beta > 1.5:  # Highly volatile
-        risk_score += 40
-    elif beta > 1.2:  # More volatile than market
-        risk_score += 30
-    elif beta > 0.8:  # Around market volatility
-        risk_score += 20
-    else:  # Less volatile than market
-        risk_score += 15
-    
-    # R-squared contribution (40% weight)
-    if r_squared < 30:  # Low correlation to benchmark
-        risk_score += 40
-    elif r_squared < 50:  # Moderate correlation
-        risk_score += 30
-    elif r_squared < 70:  # Good correlation
-        risk_score += 20
-    else:  # High correlation
-        risk_score += 15
-    
+    return _build_risk_report(alpha, beta, r_squared, int(_risk_core(alpha, beta, r_squared)))
+
+
+def _build_risk_report(alpha: float, beta: float, r_squared: float, risk_score: int) -> dict:
     # Risk level classification
     if risk_score >= 70:
         risk_level = "HIGH"
@@ -233,58 +320,200 @@ def calculate_risk_score(alpha: float, beta: float, r_squared: float) -> dict:
         }
     }
 
+
+def calculate_risk_scores_vectorized(alphas, betas, r_squareds) -> np.ndarray:
+    """Score a whole watchlist of Alpha/Beta/R-Squared triples at once.
+
+    Three np.digitize passes replace N trips through the scalar branch
+    cascade, so per-element cost is a table lookup instead of Python
+    dispatch.
+    """
+    alphas = np.asarray(alphas, dtype=np.float64)
+    betas = np.asarray(betas, dtype=np.float64)
+    r_squareds = np.asarray(r_squareds, dtype=np.float64)
+    # Alpha's upper edge is right-closed while its lower edge is
+    # left-closed, which no single digitize mode expresses; patch the
+    # boundary after the left-closed pass.
+    alpha_bins = np.digitize(alphas, _ALPHA_THRESHOLDS)
+    alpha_bins[alphas == 0.05] = 2
+    return (
+        _ALPHA_WEIGHTS[alpha_bins]
+        + _BETA_WEIGHTS[np.digitize(betas, _BETA_THRESHOLDS, right=True)]
+        + _R2_WEIGHTS[np.digitize(r_squareds, _R2_THRESHOLDS)]
+    )
+
+
+def calculate_risk_score_batch(items: list) -> list:
+    """Score several Alpha/Beta/R-Squared scenarios in one tool call.
+
+    Each item is a dict with "alpha", "beta" and "r_squared" keys. One
+    batch invocation replaces N LLM round-trips re-invoking the scalar
+    tool, and the scores come from one pass through the vectorized
+    digitize kernel instead of N trips through the branch ladder.
+    """
+    scores = calculate_risk_scores_vectorized(
+        [item["alpha"] for item in items],
+        [item["beta"] for item in items],
+        [item["r_squared"] for item in items],
+    )
+    return [
+        _build_risk_report(item["alpha"], item["beta"], item["r_squared"], int(score))
+        for item, score in zip(items, scores)
+    ]
+
+
 risk_calculation_tool = FunctionTool(
     calculate_risk_score, 
     description="Calculate comprehensive risk score based on Alpha, Beta, and R-Squared metrics"
 )
 
-risk_assessor_agent = AssistantAgent(
-    name="Risk_Assessor",
-    model_client=model_client,
-    tools=[google_search_tool, risk_calculation_tool],
-    description="Specialized in risk assessment, portfolio management, and risk scoring",
-    system_message="""You are a risk assessment specialist with expertise in quantitative risk metrics. Your role is to:
-    1. Calculate comprehensive risk scores using Alpha, Beta, and R-Squared metrics
-    2. Identify potential risks to the investment
-    3. Assess market volatility and sector risks
-    4. Evaluate company-specific risks
-    5. Provide risk mitigation strategies
-    6. Calculate risk-adjusted returns
+risk_batch_calculation_tool = FunctionTool(
+    calculate_risk_score_batch,
+    description="Calculate risk scores for multiple Alpha/Beta/R-Squared scenarios in a single call"
+)
+
+@functools.cache
+def get_agents() -> tuple:
+    """Build the five analyst agents on first use.
+
+    Constructing the AssistantAgents binds the model client and allocates
+    tool schemas; doing it lazily keeps importing this module (e.g. from
+    tests or scripts that only need the tools) cheap.
+    """
+    model_client = get_model_client()
+
+    # Enhanced specialized agents with memory and specific roles
+    technical_analyst_agent = AssistantAgent(
+        name="Technical_Analyst",
+        model_client=model_client,
+        tools=[stock_analysis_tool],
+        description="Specialized in technical analysis, chart patterns, and trading indicators",
+        system_message="""You are a technical analyst expert. Your role is to:
+        1. Analyze stock price patterns and trends
+        2. Identify support and resistance levels
+        3. Evaluate technical indicators (RSI, MACD, moving averages)
+        4. Provide trading signals based on technical analysis
+        5. Maintain context of previous analyses for comparison
     
-    When calculating risk scores:
-    - Use the calculate_risk_score tool with available Alpha, Beta, and R-Squared data
-    - Alpha: Positive values indicate outperformance, negative indicate underperformance
-    - Beta: Values >1 indicate higher volatility than market, <1 indicate lower volatility
-    - R-Squared: Higher values (closer to 100) indicate stronger correlation to benchmark
+        Always provide specific technical insights with data backing.""",
+    )
+
+    news_researcher_agent = AssistantAgent(
+        name="News_Researcher",
+        model_client=model_client,
+        tools=[google_search_tool],
+        description="Specialized in gathering and analyzing financial news and market sentiment",
+        system_message="""You are a financial news researcher. Your role is to:
+        1. Search for recent news about the target company
+        2. Analyze market sentiment from news sources
+        3. Identify key events affecting stock performance
+        4. Track regulatory changes and industry trends
+        5. Provide context for news impact on stock price
     
-    Always provide specific risk metrics and actionable risk management recommendations.
-    Consider both upside potential and downside risks in your assessment.""",
-)
+        Focus on recent, relevant news that could affect stock performance.""",
+    )
 
-report_synthesizer_agent = AssistantAgent(
-    name="Report_Synthesizer",
-    model_client=model_client,
-    description="Creates comprehensive reports by synthesizing all analyses",
-    system_message="""You are a financial report synthesizer. Your role is to:
-    1. Combine technical, fundamental, and news analysis
-    2. Create comprehensive investment recommendations
-    3. Balance different perspectives and timeframes
-    4. Provide clear, actionable insights
-    5. Include risk assessment in final recommendations
+    fundamental_analyst_agent = AssistantAgent(
+        name="Fundamental_Analyst",
+        model_client=model_client,
+        tools=[google_search_tool],
+        description="Specialized in fundamental analysis, financial ratios, and company valuation",
+        system_message="""You are a fundamental analyst expert. Your role is to:
+        1. Analyze company financial statements and ratios
+        2. Evaluate company valuation metrics (P/E, P/B, ROE)
+        3. Assess competitive position and market share
+        4. Review earnings reports and growth projections
+        5. Provide long-term investment perspective
     
-    When you complete the comprehensive report, reply with TERMINATE.""",
-)
+        Focus on fundamental factors that drive long-term value.""",
+    )
+
+    risk_assessor_agent = AssistantAgent(
+        name="Risk_Assessor",
+        model_client=model_client,
+        tools=[google_search_tool, risk_calculation_tool, risk_batch_calculation_tool],
+        description="Specialized in risk assessment, portfolio management, and risk scoring",
+        system_message="""You are a risk assessment specialist with expertise in quantitative risk metrics. Your role is to:
+        1. Calculate comprehensive risk scores using Alpha, Beta, and R-Squared metrics
+        2. Identify potential risks to the investment
+        3. Assess market volatility and sector risks
+        4. Evaluate company-specific risks
+        5. Provide risk mitigation strategies
+        6. Calculate risk-adjusted returns
+    
+        When calculating risk scores:
+        - Use the calculate_risk_score tool with available Alpha, Beta, and R-Squared data
+        - When evaluating multiple scenarios, prefer calculate_risk_score_batch and submit them all in one call
+        - Alpha: Positive values indicate outperformance, negative indicate underperformance
+        - Beta: Values >1 indicate higher volatility than market, <1 indicate lower volatility
+        - R-Squared: Higher values (closer to 100) indicate stronger correlation to benchmark
+    
+        Always provide specific risk metrics and actionable risk management recommendations.
+        Consider both upside potential and downside risks in your assessment.""",
+    )
+
+    report_synthesizer_agent = AssistantAgent(
+        name="Report_Synthesizer",
+        model_client=model_client,
+        description="Creates comprehensive reports by synthesizing all analyses",
+        system_message="""You are a financial report synthesizer. Your role is to:
+        1. Combine technical, fundamental, and news analysis
+        2. Create comprehensive investment recommendations
+        3. Balance different perspectives and timeframes
+        4. Provide clear, actionable insights
+        5. Include risk assessment in final recommendations
+    
+        When you complete the comprehensive report, reply with TERMINATE.""",
+    )
+
+    return (
+        technical_analyst_agent,
+        news_researcher_agent,
+        fundamental_analyst_agent,
+        risk_assessor_agent,
+        report_synthesizer_agent,
+    )
+
+
+# Async console input: aioconsole when installed, otherwise input() on a
+# worker thread. Either way the event loop keeps servicing background
+# work (speculative prefetches, streaming flushes) while the user types.
+try:
+    from aioconsole import ainput as _ainput
+except ImportError:
+    def _ainput(prompt: str = ""):
+        return asyncio.to_thread(input, prompt)
+
+
+
+async def _stream_messages(stream, window: int = 20) -> deque:
+    """Print an agent run_stream as messages arrive.
+
+    Console buffers the whole trace before rendering; this consumer
+    flushes each message immediately and keeps only the last ``window``
+    messages in a bounded deque, so a 2-5 minute analysis doesn't pin its
+    entire chat history in memory. Returns the retained tail.
+    """
+    recent: deque = deque(maxlen=window)
+    async for message in stream:
+        content = getattr(message, "content", None)
+        if isinstance(content, str):
+            source = getattr(message, "source", "")
+            sys.stdout.write(f"---------- {source} ----------\n{content}\n")
+            sys.stdout.flush()
+            recent.append(message)
+    return recent
 
-# Enhanced team with specialized agents and performance tracking
-team = RoundRobinGroupChat([
-    technical_analyst_agent, 
-    news_researcher_agent, 
-    fundamental_analyst_agent,
-    risk_assessor_agent,
-    report_synthesizer_agent
-], max_turns=5)
 
 async def main():
+    # All blocking yfinance work funnels through asyncio.to_thread; give
+    # the loop one sized pool so concurrent ticker lookups overlap instead
+    # of queueing behind the small default executor
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=8, thread_name_prefix="yfin"))
+
+    technical, news, fundamental, risk, synthesizer = get_agents()
+
     # Get user input for stock ticker
     print("="*60)
     print("🚀 STOCK RESEARCH ANALYSIS SYSTEM")
@@ -301,7 +530,7 @@ async def main():
     while True:
         try:
             # Get stock ticker from user
-            ticker = input("\n📈 Enter stock ticker symbol (e.g., AAPL, MSFT, GOOGL) or 'quit' to exit: ").strip().upper()
+            ticker = (await _ainput("\n📈 Enter stock ticker symbol (e.g., AAPL, MSFT, GOOGL) or 'quit' to exit: ")).strip().upper()
             
             if ticker.lower() in ['quit', 'exit', 'q']:
                 print("\n👋 Thank you for using the Stock Research Analysis System!")
@@ -333,15 +562,20 @@ async def main():
             if not is_valid:
                 print(validation_msg)
                 continue
-            
+
+            # Kick off the company-info fetch so the Yahoo round-trip
+            # overlaps the prints below; only validated tickers reach
+            # here, so no request is wasted on malformed input
+            info_task = asyncio.create_task(asyncio.to_thread(get_company_info, ticker))
+
             # Show company information for confirmation
             print(f"\n🔍 Verifying ticker symbol: {ticker}")
-            company_info = get_company_info(ticker)
+            company_info = await info_task
             print(f"\n📋 Company Information:")
             print(company_info)
             
             # Ask user to confirm
-            confirm = input(f"\n✅ Is this the company you want to analyze? (y/n): ").strip().lower()
+            confirm = (await _ainput(f"\n✅ Is this the company you want to analyze? (y/n): ")).strip().lower()
             if confirm not in ['y', 'yes', 'yeah', 'sure', '']:
                 print("🔄 Please enter the correct ticker symbol.")
                 continue
@@ -362,8 +596,27 @@ async def main():
                 # Create dynamic task with user's ticker
                 task = f"Write a comprehensive financial report on {ticker} including technical analysis, fundamental analysis, news sentiment, and risk assessment"
                 
-                stream = team.run_stream(task=task)
-                await Console(stream)
+                # The four analysts only need the ticker, so they run
+                # concurrently; end-to-end latency is max of their times
+                # plus the synthesis step instead of the sum of all five.
+                # TaskGroup gives structured cancellation: if one analyst
+                # raises, the siblings are cancelled instead of burning
+                # tokens on a report that will never be synthesized.
+                analysts = (technical, news, fundamental, risk)
+                async with asyncio.TaskGroup() as tg:
+                    analyst_tasks = [tg.create_task(agent.run(task=task)) for agent in analysts]
+                analyses = "\n\n".join(
+                    f"=== {agent.name} ===\n{t.result().messages[-1].content}"
+                    for agent, t in zip(analysts, analyst_tasks)
+                )
+                print(analyses)
+
+                synthesis_task = (
+                    f"Synthesize the following analyses of {ticker} into a "
+                    f"comprehensive financial report with an investment "
+                    f"recommendation:\n\n{analyses}"
+                )
+                await _stream_messages(synthesizer.run_stream(task=synthesis_task))
                 performance_tracker.end_call("Team_Analysis", success=True)
                 
                 # Print performance report
@@ -374,7 +627,7 @@ async def main():
                 print("="*50)
                 
                 # Ask if user wants to analyze another stock
-                another = input(f"\n🔍 Would you like to analyze another stock? (y/n): ").strip().lower()
+                another = (await _ainput(f"\n🔍 Would you like to analyze another stock? (y/n): ")).strip().lower()
                 if another not in ['y', 'yes', 'yeah', 'sure']:
                     print("\n👋 Thank you for using the Stock Research Analysis System!")
                     break
@@ -385,7 +638,7 @@ async def main():
                 print("💡 Please check if the ticker symbol is correct and try again.")
                 
                 # Ask if user wants to try another stock
-                retry = input(f"\n🔄 Would you like to try another stock? (y/n): ").strip().lower()
+                retry = (await _ainput(f"\n🔄 Would you like to try another stock? (y/n): ")).strip().lower()
                 if retry not in ['y', 'yes', 'yeah', 'sure']:
                     print("\n👋 Thank you for using the Stock Research Analysis System!")
                     break
@@ -397,9 +650,10 @@ async def main():
             print(f"\n❌ Unexpected error: {e}")
             print("💡 Please try again or contact support if the issue persists.")
     
-    # Close the model client
-    await model_client.close()
+async def _run() -> None:
+    async with model_client_lifespan():
+        await main()
+
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(_run())
\ No newline at end of file
@@ -1,3 +1,32 @@
+# Search results for a given query barely change within a session, but
+# several agents routinely ask near-identical questions about the same
+# ticker. A small least-frequently-used cache keyed by the normalized
+# query short-circuits those repeats, saving the API quota hit and the
+# ~1s-per-result politeness sleep. Hand-rolled on a dict to avoid a
+# cachetools dependency for one cache.
+_SEARCH_CACHE: dict = {}  # key -> [hit_count, results]
+_SEARCH_CACHE_MAXSIZE = 64
+
+
+def _cache_key(query: str, num_results: int, max_chars: int) -> tuple:
+    return (" ".join(query.lower().split()), num_results, max_chars)
+
+
+def _cache_get(key: tuple):
+    entry = _SEARCH_CACHE.get(key)
+    if entry is None:
+        return None
+    entry[0] += 1
+    return entry[1]
+
+
+def _cache_put(key: tuple, results: list) -> None:
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAXSIZE and key not in _SEARCH_CACHE:
+        evict = min(_SEARCH_CACHE, key=lambda k: _SEARCH_CACHE[k][0])
+        del _SEARCH_CACHE[evict]
+    _SEARCH_CACHE[key] = [0, results]
+
+
 def google_search(query: str, num_results: int = 2, max_chars: int = 500) -> list:  # type: ignore[type-arg]
     import os
     import time
@@ -6,6 +35,11 @@ def google_search(query: str, num_results: int = 2, max_chars: int = 500) -> lis
     from bs4 import BeautifulSoup
     from dotenv import load_dotenv
 
+    key = _cache_key(query, num_results, max_chars)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
     load_dotenv()
 
     api_key = os.getenv("GOOGLE_API_KEY")
@@ -49,4 +83,5 @@ def google_search(query: str, num_results: int = 2, max_chars: int = 500) -> lis
         )
         time.sleep(1)  # Be respectful to the servers
 
-    return enriched_results
\ No newline at end of file
+    _cache_put(key, enriched_results)
+    return enriched_results